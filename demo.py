@@ -5,6 +5,7 @@ QoLib Demo - Full library capabilities demonstration
 Run: python demo.py
 """
 
+import sys
 import time
 import random
 from qolib import *
@@ -15,64 +16,61 @@ def demo_colors():
     print(ArtService.banner("COLORS", color=Color.CYAN))
     print()
     
-    # Basic colors
-    print("Basic colors:")
-    print(Color.BLACK + "Black" + Color.RESET, end=" ")
-    print(Color.RED + "Red" + Color.RESET, end=" ")
-    print(Color.GREEN + "Green" + Color.RESET, end=" ")
-    print(Color.YELLOW + "Yellow" + Color.RESET, end=" ")
-    print(Color.BLUE + "Blue" + Color.RESET, end=" ")
-    print(Color.MAGENTA + "Magenta" + Color.RESET, end=" ")
-    print(Color.CYAN + "Cyan" + Color.RESET, end=" ")
-    print(Color.WHITE + "White" + Color.RESET)
-    
-    print("\nBright colors:")
-    print(Color.GRAY + "Gray" + Color.RESET, end=" ")
-    print(Color.LIGHT_RED + "Light Red" + Color.RESET, end=" ")
-    print(Color.LIGHT_GREEN + "Light Green" + Color.RESET, end=" ")
-    print(Color.LIGHT_YELLOW + "Light Yellow" + Color.RESET, end=" ")
-    print(Color.LIGHT_BLUE + "Light Blue" + Color.RESET, end=" ")
-    print(Color.LIGHT_MAGENTA + "Light Magenta" + Color.RESET, end=" ")
-    print(Color.LIGHT_CYAN + "Light Cyan" + Color.RESET, end=" ")
-    print(Color.LIGHT_WHITE + "Light White" + Color.RESET)
-    
-    print("\nText styles:")
-    print(Color.BOLD + "Bold" + Color.RESET, end=" ")
-    print(Color.DIM + "Dim" + Color.RESET, end=" ")
-    print(Color.ITALIC + "Italic" + Color.RESET, end=" ")
-    print(Color.UNDERLINE + "Underlined" + Color.RESET, end=" ")
-    print(Color.BLINK + "Blinking" + Color.RESET, end=" ")
-    print(Color.REVERSE + "Reversed" + Color.RESET)
-    
-    print("\nBackground colors:")
-    print(Color.BG_RED + "Red background" + Color.RESET, end=" ")
-    print(Color.BG_GREEN + "Green background" + Color.RESET, end=" ")
-    print(Color.BG_BLUE + "Blue background" + Color.RESET, end=" ")
-    print(Color.BG_YELLOW + "Yellow background" + Color.RESET)
-    
-    print("\nRGB colors:")
-    for r, g, b, name in [
-        (255, 105, 180, "Pink"),
-        (255, 165, 0, "Orange"),
-        (50, 205, 50, "Lime"),
-        (30, 144, 255, "Light Blue"),
-        (138, 43, 226, "Purple")
-    ]:
-        print(Color.fg_rgb(r, g, b) + name + Color.RESET, end=" ")
-    
-    print("\n\nHEX colors:")
-    for hex_code, name in [
-        ("#FF6B6B", "Coral"),
-        ("#4ECDC4", "Turquoise"),
-        ("#FFE66D", "Lemon"),
-        ("#6A0572", "Violet"),
-        ("#1A535C", "Dark Teal")
-    ]:
-        print(Color.fg_hex(hex_code) + name + Color.RESET, end=" ")
-    
-    print("\n\nGradients:")
-    print(Color.gradient("Rainbow gradient", Color.RAINBOW))
-    print(Color.gradient("Pastel gradient", Color.PASTEL))
+    # Collect the whole showcase and write it in one go
+    def swatches(items):
+        return " ".join(style + name + Color.RESET for style, name in items)
+    
+    out = [
+        "Basic colors:\n",
+        swatches([
+            (Color.BLACK, "Black"), (Color.RED, "Red"), (Color.GREEN, "Green"),
+            (Color.YELLOW, "Yellow"), (Color.BLUE, "Blue"), (Color.MAGENTA, "Magenta"),
+            (Color.CYAN, "Cyan"), (Color.WHITE, "White"),
+        ]),
+        "\n\nBright colors:\n",
+        swatches([
+            (Color.GRAY, "Gray"), (Color.LIGHT_RED, "Light Red"),
+            (Color.LIGHT_GREEN, "Light Green"), (Color.LIGHT_YELLOW, "Light Yellow"),
+            (Color.LIGHT_BLUE, "Light Blue"), (Color.LIGHT_MAGENTA, "Light Magenta"),
+            (Color.LIGHT_CYAN, "Light Cyan"), (Color.LIGHT_WHITE, "Light White"),
+        ]),
+        "\n\nText styles:\n",
+        swatches([
+            (Color.BOLD, "Bold"), (Color.DIM, "Dim"), (Color.ITALIC, "Italic"),
+            (Color.UNDERLINE, "Underlined"), (Color.BLINK, "Blinking"),
+            (ANSIColor.REVERSE, "Reversed"),
+        ]),
+        "\n\nBackground colors:\n",
+        swatches([
+            (ANSIColor.BG_RED, "Red background"), (ANSIColor.BG_GREEN, "Green background"),
+            (ANSIColor.BG_BLUE, "Blue background"), (ANSIColor.BG_YELLOW, "Yellow background"),
+        ]),
+        "\n\nRGB colors:\n",
+        swatches([
+            (ANSIColor.fg_rgb(r, g, b), name) for r, g, b, name in [
+                (255, 105, 180, "Pink"),
+                (255, 165, 0, "Orange"),
+                (50, 205, 50, "Lime"),
+                (30, 144, 255, "Light Blue"),
+                (138, 43, 226, "Purple")
+            ]
+        ]),
+        " \n\nHEX colors:\n",
+        swatches([
+            (Color.fg_hex(hex_code), name) for hex_code, name in [
+                ("#FF6B6B", "Coral"),
+                ("#4ECDC4", "Turquoise"),
+                ("#FFE66D", "Lemon"),
+                ("#6A0572", "Violet"),
+                ("#1A535C", "Dark Teal")
+            ]
+        ]),
+        " \n\nGradients:\n",
+        Color.gradient("Rainbow gradient", Color.RAINBOW), "\n",
+        Color.gradient("Pastel gradient", Color.PASTEL), "\n",
+    ]
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
     
     input("\n\nPress Enter to continue...")
 
@@ -356,10 +354,11 @@ def demo_utilities():
     print("Text 1")
     print("Text 2")
     
-    ConsoleUtils.save_position()
-    ConsoleUtils.move_cursor(0, ConsoleUtils.get_size()[1] - 3)
-    print("This text appeared at the bottom of the screen")
-    ConsoleUtils.restore_position()
+    with ConsoleUtils.cursor_batch() as batch:
+        ConsoleUtils.save_position()
+        ConsoleUtils.move_cursor(0, ConsoleUtils.get_size()[1] - 3)
+        batch.write("This text appeared at the bottom of the screen\n")
+        ConsoleUtils.restore_position()
     print("And we returned to the old position")
     
     # Hide/show cursor
@@ -537,14 +536,16 @@ def main():
         "0": ("🚪 Exit", exit)
     }
     
+    # The menu never changes, so render it once
+    menu = "\n".join([
+        "\n" + ArtService.separator(60, "═", Color.CYAN),
+        "\nSelect demonstration:\n",
+        *(f"  {Color.CYAN}{key}.{Color.RESET} {name}" for key, (name, _) in demos.items()),
+        "\n" + ArtService.separator(60, "─", Color.GRAY),
+    ])
+    
     while True:
-        print("\n" + ArtService.separator(60, "═", Color.CYAN))
-        print("\nSelect demonstration:\n")
-        
-        for key, (name, _) in demos.items():
-            print(f"  {Color.CYAN}{key}.{Color.RESET} {name}")
-        
-        print("\n" + ArtService.separator(60, "─", Color.GRAY))
+        print(menu)
         
         choice = input(f"\n{Color.LIGHT_CYAN}Your choice (1-7, 0 to exit): {Color.RESET}").strip()
         
@@ -4,10 +4,148 @@ import time
 import random
 import math
 import re
+from bisect import bisect_left
 from enum import Enum
 from typing import List, Optional, Union, Tuple, Dict, Any
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# ============================================================================
+# INTERNAL HELPERS
+# ============================================================================
+
+# Shortest interval between stdout flushes in animations (~60 fps)
+_FRAME_TIME = 0.016
+
+# Shortest interval between ProgressBar redraws that don't move the bar (~30 Hz)
+_PROGRESS_REDRAW_INTERVAL = 0.033
+
+# Longest a ProgressBar goes without a redraw, so the counter and times keep moving
+_PROGRESS_REFRESH_INTERVAL = 0.5
+
+# How long ConsoleUtils.get_size() reuses the last queried terminal size
+_SIZE_TTL = 0.1
+
+# ANSI SGR sequences, compiled once (strip_colors is called per line/cell)
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# Stays on while the escape constants and message styles below are built,
+# then set from _detect_colors(); when off, every escape constant becomes
+# empty. Color.force_colors() overrides it at runtime
+_COLORS_ENABLED = True
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Indentation strings for the common depths
+_INDENTS = [" " * i for i in range(64)]
+
+# Terminal size cache: [monotonic time of last query, size]
+_size_cache = [float('-inf'), (80, 24)]
+
+# Open cursor batches, keyed by thread id (empty when none are active)
+_cursor_batches: Dict[int, List[str]] = {}
+
+
+def _visible_len(text: str) -> int:
+    """Length of text as shown on screen, skipping ANSI escape sequences"""
+    if '\x1b' not in text:
+        return len(text)
+    
+    length = 0
+    pos = 0
+    end = len(text)
+    while pos < end:
+        esc = text.find('\x1b', pos)
+        if esc < 0:
+            length += end - pos
+            break
+        length += esc - pos
+        # Skip exactly what strip_colors removes; any other ESC is counted
+        match = _ANSI_RE.match(text, esc)
+        if match:
+            pos = match.end()
+        else:
+            length += 1
+            pos = esc + 1
+    return length
+
+
+def _detect_colors() -> bool:
+    """Colors are used on terminals unless NO_COLOR is set (no-color.org)"""
+    if os.environ.get('NO_COLOR'):
+        return False
+    isatty = getattr(sys.stdout, 'isatty', None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError:
+        # stdout already closed
+        return False
+
+
+def _blank(value):
+    """Empty counterpart of an escape constant or palette"""
+    if isinstance(value, (list, tuple)):
+        return type(value)(_blank(item) for item in value)
+    return value[:0]
+
+
+def _is_escape(value) -> bool:
+    """Whether value is an ANSI escape constant or a palette of them"""
+    if isinstance(value, (list, tuple)):
+        return bool(value) and all(_is_escape(item) for item in value)
+    return isinstance(value, str) and value.startswith('\033')
+
+
+def _apply_color_mode() -> None:
+    """Set escape constants to their originals or blanks per _COLORS_ENABLED"""
+    for cls, originals in _ANSI_ORIGINALS.items():
+        for name, value in originals.items():
+            setattr(cls, name, value if _COLORS_ENABLED else _blank(value))
+
+
+@lru_cache(maxsize=128)
+def _gradient(text: str, colors: Tuple[str, ...]) -> str:
+    """Color.gradient body, memoized by (text, palette)"""
+    n = len(text)
+    m = len(colors)
+    if m == 1:
+        return colors[0] + text + Color.RESET
+
+    # Split the text into m equal bands and emit each color once,
+    # at the first non-space character of its band
+    result = []
+    append = result.append
+    last_idx = -1
+    for i, char in enumerate(text):
+        color_idx = i * m // n
+        if char != ' ' and color_idx != last_idx:
+            append(colors[color_idx])
+            last_idx = color_idx
+        append(char)
+
+    return ''.join(result) + Color.RESET
+
+
+@lru_cache(maxsize=64)
+def _separator(length: int, char: str, color: str) -> str:
+    """ArtService.separator body, memoized by its arguments"""
+    return f"{color}{char * length}{Color.RESET}"
+
+
+def _cursor_write(sequence: str) -> None:
+    """Queue a cursor sequence in this thread's batch, or write it now"""
+    if _cursor_batches:
+        import threading
+        batch = _cursor_batches.get(threading.get_ident())
+        if batch is not None:
+            batch.append(sequence)
+            return
+    
+    sys.stdout.write(sequence)
+    sys.stdout.flush()
+
 
 # ============================================================================
 # COLOR AND STYLE SYSTEM (no external dependencies)
@@ -72,19 +210,27 @@ class ANSIColor:
     # 256 colors
     @staticmethod
     def fg_256(color_code: int) -> str:
+        if not _COLORS_ENABLED:
+            return ''
         return f'\033[38;5;{color_code}m'
     
     @staticmethod
     def bg_256(color_code: int) -> str:
+        if not _COLORS_ENABLED:
+            return ''
         return f'\033[48;5;{color_code}m'
     
     # TrueColor (RGB)
     @staticmethod
     def fg_rgb(r: int, g: int, b: int) -> str:
+        if not _COLORS_ENABLED:
+            return ''
         return f'\033[38;2;{r};{g};{b}m'
     
     @staticmethod
     def bg_rgb(r: int, g: int, b: int) -> str:
+        if not _COLORS_ENABLED:
+            return ''
         return f'\033[48;2;{r};{g};{b}m'
 
 
@@ -119,32 +265,37 @@ class Color:
     UNDERLINE = ANSIColor.UNDERLINE
     BLINK = ANSIColor.BLINK
     
-    # Color palettes
-    RAINBOW = [RED, YELLOW, GREEN, CYAN, BLUE, MAGENTA]
-    PASTEL = [
+    # Color palettes (tuples, so they can key the gradient cache)
+    RAINBOW = (RED, YELLOW, GREEN, CYAN, BLUE, MAGENTA)
+    PASTEL = (
         ANSIColor.fg_rgb(255, 179, 186),  # pastel pink
         ANSIColor.fg_rgb(255, 223, 186),  # pastel peach
         ANSIColor.fg_rgb(255, 255, 186),  # pastel yellow
         ANSIColor.fg_rgb(186, 255, 201),  # pastel green
         ANSIColor.fg_rgb(186, 225, 255),  # pastel blue
         ANSIColor.fg_rgb(225, 186, 255),  # pastel purple
-    ]
+    )
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         """Convert HEX to RGB"""
         hex_color = hex_color.lstrip('#')
         if len(hex_color) == 3:
             hex_color = ''.join(c*2 for c in hex_color)
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        # Exactly the first 6 digits (alpha in #RRGGBBAA is ignored)
+        r, g, b = bytes.fromhex(hex_color[:6])
+        return r, g, b
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def fg_hex(hex_color: str) -> str:
         """Text color from HEX"""
         r, g, b = Color.hex_to_rgb(hex_color)
         return ANSIColor.fg_rgb(r, g, b)
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def bg_hex(hex_color: str) -> str:
         """Background color from HEX"""
         r, g, b = Color.hex_to_rgb(hex_color)
@@ -153,36 +304,38 @@ class Color:
     @staticmethod
     def gradient(text: str, colors: List[str]) -> str:
         """Gradient text"""
-        if not colors:
+        if not colors or not _COLORS_ENABLED:
             return text
-        
-        result = []
-        step = len(text) / (len(colors) - 1) if len(colors) > 1 else 1
-        
-        for i, char in enumerate(text):
-            if char == ' ':
-                result.append(char)
-                continue
-                
-            color_idx = min(int(i / step), len(colors) - 1)
-            next_idx = min(color_idx + 1, len(colors) - 1)
-            
-            # Interpolation between colors
-            if color_idx == next_idx:
-                result.append(f"{colors[color_idx]}{char}")
-            else:
-                pos = (i % step) / step
-                result.append(f"{colors[color_idx]}{char}")
-        
-        return ''.join(result) + Color.RESET
+        return _gradient(text, tuple(colors))
     
     @staticmethod
     def strip_colors(text: str) -> str:
         """Remove all ANSI escape sequences from text"""
-        return re.sub(r'\033\[[0-9;]*m', '', text)
+        return _ANSI_RE.sub('', text)
+    
+    @staticmethod
+    def force_colors(enabled: bool = True) -> None:
+        """Turn ANSI output on or off, overriding TTY/NO_COLOR detection"""
+        # Colors captured by callers before the switch (Color.RED passed
+        # to a widget, a style registered while off) keep their old value
+        global _COLORS_ENABLED
+        _COLORS_ENABLED = bool(enabled)
+        _apply_color_mode()
+        Color.fg_hex.cache_clear()
+        Color.bg_hex.cache_clear()
+        _separator.cache_clear()
+        MessageService._timestamp_cache = (-1, "")
+        MessageService._rebuild_prefix_cache()
+
+
+# Original escape constants, kept so the color mode can be re-applied
+_ANSI_ORIGINALS = {
+    cls: {name: value for name, value in vars(cls).items() if _is_escape(value)}
+    for cls in (ANSIColor, Color)
+}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MessageStyle:
     """Style for messages"""
     prefix: str
@@ -191,6 +344,17 @@ class MessageStyle:
     icon: str = ""
     timestamp: bool = False
     indent: int = 0
+    # Header ("icon [prefix] ") rendered once by MessageService
+    _rendered: str = field(default="", init=False, repr=False, compare=False)
+    
+    def _render(self, show_icons: bool) -> None:
+        """Pre-render the message header for the given icon setting"""
+        # Styles keep their escapes; they are only left out while colors are off
+        color = self.color + self.style if _COLORS_ENABLED else ""
+        header = f"{color}{self.prefix}{Color.RESET}"
+        if show_icons and self.icon:
+            header = f"{color}{self.icon}{Color.RESET} {header}"
+        self._rendered = header + " "
 
 
 class MessageType(Enum):
@@ -271,6 +435,11 @@ class MessageService:
     _show_timestamps: bool = False
     _timestamp_format: str = "%H:%M:%S"
     
+    # Style key -> (rendered header + open text color, style indent)
+    _prefix_cache: Dict[Union[MessageType, str], Tuple[str, int]] = {}
+    # (epoch second, rendered timestamp) of the last formatted timestamp
+    _timestamp_cache: Tuple[int, str] = (-1, "")
+    
     @classmethod
     def configure(cls,
                   show_icons: bool = None,
@@ -279,10 +448,12 @@ class MessageService:
         """Configure the message service"""
         if show_icons is not None:
             cls._show_icons = show_icons
+            cls._rebuild_prefix_cache()
         if show_timestamps is not None:
             cls._show_timestamps = show_timestamps
         if timestamp_format is not None:
             cls._timestamp_format = timestamp_format
+            cls._timestamp_cache = (-1, "")
     
     @classmethod
     def register_style(cls,
@@ -298,6 +469,18 @@ class MessageService:
             style=style,
             icon=icon
         )
+        cls._rebuild_prefix_cache()
+    
+    @classmethod
+    def _rebuild_prefix_cache(cls) -> None:
+        """Re-render all style headers and refresh the prefix cache"""
+        cache = {}
+        for styles in (cls._STYLES, cls._custom_styles):
+            for key, style in styles.items():
+                style._render(cls._show_icons)
+                header = style._rendered + (style.color if _COLORS_ENABLED else "")
+                cache[key] = (header, style.indent)
+        cls._prefix_cache = cache
     
     @classmethod
     def print(cls,
@@ -307,36 +490,43 @@ class MessageService:
               indent: int = 0,
               flush: bool = False) -> None:
         """Universal method for outputting messages"""
+        stream = sys.stdout
+        if stream is None:
+            return
         
-        # Get style
-        if isinstance(message_type, MessageType):
-            style = cls._STYLES.get(message_type)
-        else:
-            style = cls._custom_styles.get(message_type)
-        
-        if not style:
-            style = cls._STYLES[MessageType.INFO]
-        
-        # Prepare prefix
-        prefix_parts = []
-        
-        if cls._show_timestamps:
-            time_str = datetime.now().strftime(cls._timestamp_format)
-            prefix_parts.append(f"{Color.DIM}{time_str}{Color.RESET}")
-        
-        if cls._show_icons and style.icon:
-            prefix_parts.append(f"{style.color}{style.style}{style.icon}{Color.RESET}")
-        
-        prefix_parts.append(f"{style.color}{style.style}{style.prefix}{Color.RESET}")
+        # Rendered prefix, ending in the style's text color
+        cached = cls._prefix_cache.get(message_type)
+        if cached is None:
+            cached = cls._prefix_cache[MessageType.INFO]
+        prefix, style_indent = cached
+        timestamp = cls._timestamp() if cls._show_timestamps else ""
+        indent += style_indent
         
-        prefix = " ".join(prefix_parts)
+        # Fast path for the default setup: no timestamp, no indentation
+        if not (timestamp or indent):
+            stream.write(f"{prefix}{text}{Color.RESET}{end}")
+        else:
+            indent_str = _INDENTS[indent] if 0 <= indent < len(_INDENTS) else " " * indent
+            ConsoleUtils.emit(indent_str, timestamp, prefix, text, Color.RESET, end)
         
-        # Form indentation
-        indent_str = " " * (style.indent + indent)
+        # Terminals (line-buffered stdout) already flush on the newline
+        if flush:
+            stream.flush()
+    
+    @classmethod
+    def _timestamp(cls) -> str:
+        """Dimmed timestamp and separator, formatted at most once per second"""
+        fmt = cls._timestamp_format
+        if '%f' in fmt:
+            # Sub-second formats can't be cached (and need datetime)
+            return f"{Color.DIM}{datetime.now().strftime(fmt)}{Color.RESET} "
         
-        # Output
-        full_text = f"{indent_str}{prefix} {style.color}{text}{Color.RESET}"
-        print(full_text, end=end, flush=flush)
+        now = time.time()
+        second = int(now)
+        if cls._timestamp_cache[0] != second:
+            time_str = time.strftime(fmt, time.localtime(now))
+            cls._timestamp_cache = (second, f"{Color.DIM}{time_str}{Color.RESET} ")
+        return cls._timestamp_cache[1]
     
     # Quick methods
     @classmethod
@@ -378,6 +568,18 @@ class MessageService:
     @classmethod
     def custom(cls, name: str, text: str, **kwargs) -> None:
         cls.print(name, text, **kwargs)
+    
+    @classmethod
+    def flush(cls) -> None:
+        """Flush buffered message output"""
+        sys.stdout.flush()
+
+
+_COLORS_ENABLED = _detect_colors()
+if not _COLORS_ENABLED:
+    _apply_color_mode()
+
+MessageService._rebuild_prefix_cache()
 
 
 class AnimationService:
@@ -407,30 +609,54 @@ class AnimationService:
                   message: str = "Waiting",
                   end_message: str = "Ready!") -> None:
         """Countdown timer"""
-        for i in range(seconds, 0, -1):
-            sys.stdout.write(f"\r{message}: {Color.YELLOW}{i}{Color.RESET} sec.   ")
-            sys.stdout.flush()
-            time.sleep(1)
-        sys.stdout.write(f"\r{end_message}{' ' * 20}\n")
-        sys.stdout.flush()
+        frames = [f"\r{message}: {Color.YELLOW}{i}{Color.RESET} sec.   "
+                  for i in range(seconds, 0, -1)]
+        
+        # Tick against a monotonic deadline so the countdown doesn't drift
+        deadline = time.monotonic()
+        for frame in frames:
+            ConsoleUtils._write_frame(frame)
+            deadline += 1
+            time.sleep(max(0.0, deadline - time.monotonic()))
+        
+        ConsoleUtils._write_frame(f"\r{end_message}{' ' * 20}\n")
     
     @staticmethod
     def typing_effect(text: str,
                       speed: float = 0.05,
-                      color: str = Color.WHITE,
+                      color: str = None,
                       pause_chars: str = ".!?",
                       pause_duration: float = 0.3) -> None:
         """Typing effect with pauses on punctuation"""
+        if color is None:
+            color = Color.WHITE
+        
+        # Hot loop: bind attribute lookups to locals once
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        reset = Color.RESET
+        pauses = frozenset(pause_chars)
+        last_flush = perf_counter()
+        
         for char in text:
-            sys.stdout.write(color + char + Color.RESET)
-            sys.stdout.flush()
+            write(color + char + reset)
+            pause = char in pauses
+            delay = pause_duration if pause else speed
             
-            if char in pause_chars:
-                time.sleep(pause_duration)
-            else:
-                time.sleep(speed)
+            # Flush before a pause or a visible delay (so every character at
+            # speeds of a frame or more, including the default), otherwise
+            # at most once per frame
+            now = perf_counter()
+            if pause or delay >= _FRAME_TIME or now - last_flush >= _FRAME_TIME:
+                flush()
+                last_flush = now
+            
+            sleep(delay)
         
-        print()
+        write("\n")
+        flush()
 
 
 class Spinner:
@@ -447,19 +673,38 @@ class Spinner:
         self.frames = frames or self.DEFAULT_FRAMES
         self._running = False
         self._current_frame = 0
+        # Frame lines, built when the spinner starts
+        self._rendered = None
+    
+    def _render_frames(self):
+        """Pre-render every frame line for the current message"""
+        self._rendered = tuple(f"\r{frame} {self.message}" for frame in self.frames)
     
     def start(self):
         """Start the spinner"""
         self._running = True
         self._current_frame = 0
+        self._render_frames()
         
         def spin():
+            write = ConsoleUtils._write_frame
+            perf_counter = time.perf_counter
+            sleep = time.sleep
+            
+            # Sleep until the next frame's deadline so render time doesn't
+            # add up as drift
+            target = perf_counter()
             while self._running:
-                frame = self.frames[self._current_frame % len(self.frames)]
-                sys.stdout.write(f"\r{frame} {self.message}")
-                sys.stdout.flush()
+                rendered = self._rendered
+                write(rendered[self._current_frame % len(rendered)])
                 self._current_frame += 1
-                time.sleep(self.delay)
+                
+                target += self.delay
+                now = perf_counter()
+                if target > now:
+                    sleep(target - now)
+                else:
+                    target = now  # running late, don't try to catch up
         
         import threading
         self._thread = threading.Thread(target=spin, daemon=True)
@@ -480,6 +725,8 @@ class Spinner:
     def update_message(self, new_message: str):
         """Update spinner message"""
         self.message = new_message
+        if self._rendered is not None:
+            self._render_frames()
     
     def __enter__(self):
         self.start()
@@ -508,35 +755,62 @@ class ProgressBar:
         self.incomplete_char = incomplete_char
         self.show_percentage = show_percentage
         self.show_counter = show_counter
+        
+        # Full-length bars; each frame is two slices of these
+        self._full_bar = complete_char * bar_length
+        self._empty_bar = incomplete_char * bar_length
+        self._desc_prefix = description + " " if description else ""
+        
+        # Redraw only after ~0.1% of progress (the display resolution)
+        self._render_step = max(1, total // 1000)
+        self._last_rendered = None
+        self._last_filled = -1
+        self._last_render_t = 0.0
+        
         self.start_time = time.time()
     
     def update(self, value: int = None, increment: int = 1):
         """Update progress"""
+        total = self.total
         if value is not None:
-            self.current = min(value, self.total)
+            current = min(value, total)
         else:
-            self.current = min(self.current + increment, self.total)
+            current = min(self.current + increment, total)
+        self.current = current
+        
+        # Throttle redraws; the first and the final frame are always drawn
+        if current != total and self._last_rendered is not None:
+            since_render = time.perf_counter() - self._last_render_t
+            if since_render < _PROGRESS_REFRESH_INTERVAL:
+                if abs(current - self._last_rendered) < self._render_step:
+                    return
+                
+                filled_length = int(self.bar_length * current / total)
+                if (filled_length == self._last_filled and
+                        since_render < _PROGRESS_REDRAW_INTERVAL):
+                    return
         
         self._render()
     
     def _render(self):
         """Render the progress bar"""
-        progress = self.current / self.total
+        current = self.current
+        total = self.total
+        progress = current / total
         filled_length = int(self.bar_length * progress)
         
         # Bar
-        bar = self.complete_char * filled_length + \
-              self.incomplete_char * (self.bar_length - filled_length)
+        bar = self._full_bar[:filled_length] + self._empty_bar[filled_length:]
         
         # Percentage
-        percentage = f"{progress * 100:.1f}%" if self.show_percentage else ""
+        percentage = "%.1f%%" % (progress * 100) if self.show_percentage else ""
         
         # Counter
-        counter = f"{self.current}/{self.total}" if self.show_counter else ""
+        counter = "%s/%s" % (current, total) if self.show_counter else ""
         
         # Time
         elapsed = time.time() - self.start_time
-        if self.current > 0 and progress < 1:
+        if current > 0 and progress < 1:
             remaining = (elapsed / progress) * (1 - progress)
             time_str = f" [{elapsed:.0f}<{remaining:.0f}s]"
         elif progress >= 1:
@@ -545,25 +819,20 @@ class ProgressBar:
             time_str = ""
         
         # Build string
-        parts = []
-        if self.description:
-            parts.append(self.description)
-        
-        parts.append(f"[{bar}]")
-        
+        parts = [self._desc_prefix, "[", bar, "]"]
         if percentage:
-            parts.append(percentage)
-        
+            parts += (" ", percentage)
         if counter:
-            parts.append(counter)
+            parts += (" ", counter)
+        parts += (" ", time_str)
         
-        parts.append(time_str)
-        
-        line = " ".join(parts)
+        line = "".join(parts)
+        self._last_rendered = current
+        self._last_filled = filled_length
+        self._last_render_t = time.perf_counter()
         
         # Output
-        sys.stdout.write(f"\r{line}")
-        sys.stdout.flush()
+        ConsoleUtils._write_frame("\r", line)
     
     def finish(self):
         """Finish the progress bar"""
@@ -586,9 +855,9 @@ class TablePrinter:
                  column_align: List[str] = None,
                  padding: int = 1,
                  border_style: str = "rounded",
-                 header_color: str = Color.CYAN + Color.BOLD,
+                 header_color: str = None,
                  zebra_stripes: bool = False,
-                 stripe_color: str = Color.DIM):
+                 stripe_color: str = None):
         
         self.headers = headers
         self.rows = []
@@ -663,108 +932,86 @@ class TablePrinter:
         """Add multiple rows"""
         self.rows.extend(rows)
     
+    @staticmethod
+    def _align(text: str, width: int, align: str) -> str:
+        """Pad text to the given visible width"""
+        # Escape sequences take no screen space, so widen by their length
+        width += len(text) - _visible_len(text)
+        
+        if align == "center":
+            return text.center(width)
+        elif align == "right":
+            return text.rjust(width)
+        return text.ljust(width)
+    
     def print(self):
         """Print the table"""
-        # Determine column widths
-        col_widths = []
-        for i in range(len(self.headers)):
-            max_width = len(str(self.headers[i]))
-            for row in self.rows:
-                if i < len(row):
-                    max_width = max(max_width, len(str(row[i])))
-            col_widths.append(max_width + self.padding * 2)
+        # Determine column widths in one pass, converting each cell once
+        col_widths = [_visible_len(str(header)) for header in self.headers]
+        str_rows = []
+        for row in self.rows:
+            cells = ["" if cell is None else str(cell) for cell in row]
+            for i, cell_str in enumerate(cells):
+                width = _visible_len(cell_str)
+                if width > col_widths[i]:
+                    col_widths[i] = width
+            str_rows.append(cells)
+        col_widths = [width + self.padding * 2 for width in col_widths]
         
         border = self._border_styles.get(self.border_style, 
                                         self._border_styles["simple"])
         
+        # Hoisted for the row loop
+        horizontal = border["horizontal"]
+        vertical = border["vertical"]
+        pad = " " * self.padding
+        reset = Color.RESET
+        align_cell = self._align
+        column_align = self.column_align
+        inner_widths = [width - self.padding * 2 for width in col_widths]
+        
+        # The whole table is collected here and written at once
+        out: List[str] = []
+        
+        def rule(left: str, cross: str, right: str) -> str:
+            return left + cross.join(horizontal * width for width in col_widths) + right
+        
         # Top border
         if border["top_left"]:
-            top_border = border["top_left"]
-            for i, width in enumerate(col_widths):
-                top_border += border["horizontal"] * width
-                if i < len(col_widths) - 1:
-                    top_border += border["top_cross"]
-            top_border += border["top_right"]
-            print(top_border)
+            out.append(rule(border["top_left"], border["top_cross"], border["top_right"]))
         
-        # Headers
-        if border["vertical"]:
-            header_line = border["vertical"]
-        else:
-            header_line = ""
-            
+        # Headers (default colors are looked up now so they follow the color mode)
+        header_color = self.header_color
+        if header_color is None:
+            header_color = Color.CYAN + Color.BOLD
+        parts = [vertical]
         for i, header in enumerate(self.headers):
-            width = col_widths[i] - self.padding * 2
-            align = self.column_align[i]
-            
-            if align == "center":
-                formatted = str(header).center(width)
-            elif align == "right":
-                formatted = str(header).rjust(width)
-            else:
-                formatted = str(header).ljust(width)
-            
-            header_line += " " * self.padding + \
-                         self.header_color + formatted + Color.RESET + \
-                         " " * self.padding
-            
-            if border["vertical"]:
-                header_line += border["vertical"]
-        
-        print(header_line)
+            formatted = align_cell(str(header), inner_widths[i], column_align[i])
+            parts += (pad, header_color, formatted, reset, pad, vertical)
+        out.append("".join(parts))
         
         # Separator
         if border["left_cross"]:
-            separator = border["left_cross"]
-            for i, width in enumerate(col_widths):
-                separator += border["horizontal"] * width
-                if i < len(col_widths) - 1:
-                    separator += border["cross"]
-            separator += border["right_cross"]
-            print(separator)
+            out.append(rule(border["left_cross"], border["cross"], border["right_cross"]))
         
         # Data rows
-        for row_idx, row in enumerate(self.rows):
-            if border["vertical"]:
-                row_line = border["vertical"]
-            else:
-                row_line = ""
-            
-            # Stripe colors
-            row_color = ""
-            if self.zebra_stripes and row_idx % 2 == 1:
-                row_color = self.stripe_color
-            
-            for i, cell in enumerate(row):
-                width = col_widths[i] - self.padding * 2
-                align = self.column_align[i]
-                cell_str = str(cell) if cell is not None else ""
-                
-                if align == "center":
-                    formatted = cell_str.center(width)
-                elif align == "right":
-                    formatted = cell_str.rjust(width)
-                else:
-                    formatted = cell_str.ljust(width)
-                
-                row_line += " " * self.padding + \
-                          row_color + formatted + Color.RESET + \
-                          " " * self.padding
-                
-                if border["vertical"]:
-                    row_line += border["vertical"]
-            
-            print(row_line)
+        stripe_color = ""
+        if self.zebra_stripes:
+            stripe_color = Color.DIM if self.stripe_color is None else self.stripe_color
+        for row_idx, cells in enumerate(str_rows):
+            row_color = stripe_color if row_idx % 2 == 1 else ""
+            parts = [vertical]
+            for i, cell_str in enumerate(cells):
+                formatted = align_cell(cell_str, inner_widths[i], column_align[i])
+                parts += (pad, row_color, formatted, reset, pad, vertical)
+            out.append("".join(parts))
         
         # Bottom border
         if border["bottom_left"]:
-            bottom_border = border["bottom_left"]
-            for i, width in enumerate(col_widths):
-                bottom_border += border["horizontal"] * width
-                if i < len(col_widths) - 1:
-                    bottom_border += border["bottom_cross"]
-            bottom_border += border["bottom_right"]
-            print(bottom_border)
+            out.append(rule(border["bottom_left"], border["bottom_cross"], border["bottom_right"]))
+        
+        out.append("")
+        ConsoleUtils.emit("\n".join(out))
 
 
 class GraphPrinter:
@@ -775,29 +1022,36 @@ class GraphPrinter:
                   width: int = 50,
                   max_height: int = 10,
                   show_values: bool = True,
-                  color: str = Color.CYAN):
+                  color: str = None):
         """Bar chart"""
         
         if not data:
             return
+        if color is None:
+            color = Color.CYAN
         
-        max_value = max(data.values())
-        min_value = min(data.values())
-        
-        # Normalize data
-        normalized = {}
-        for key, value in data.items():
-            if max_value == min_value:
-                normalized[key] = max_height
-            else:
-                normalized[key] = int((value - min_value) / 
-                                    (max_value - min_value) * max_height)
+        values = list(data.values())
+        heights = GraphPrinter._bar_heights(values, max_height)
         
         # Build chart
-        for key, height in normalized.items():
+        lines = []
+        for key, value, height in zip(data, values, heights):
             bar = color + "█" * height + Color.RESET
-            value_str = f" ({data[key]})" if show_values else ""
-            print(f"{key.ljust(15)} {bar} {value_str}")
+            value_str = f" ({value})" if show_values else ""
+            lines.append(f"{key.ljust(15)} {bar} {value_str}\n")
+        
+        ConsoleUtils.emit(*lines)
+    
+    @staticmethod
+    def _bar_heights(values: List[float], max_height: int) -> List[int]:
+        """Normalize values to bar heights in [0, max_height]"""
+        max_value = max(values)
+        min_value = min(values)
+        if max_value == min_value:
+            return [max_height] * len(values)
+        
+        span = max_value - min_value
+        return [int((value - min_value) / span * max_height) for value in values]
 
 
 class ArtService:
@@ -806,9 +1060,11 @@ class ArtService:
     @staticmethod
     def banner(text: str,
                font: str = "simple",
-               color: str = Color.CYAN,
+               color: str = None,
                width: int = None) -> str:
         """Create ASCII banner"""
+        if color is None:
+            color = Color.CYAN
         
         fonts = {
             "simple": {
@@ -829,40 +1085,36 @@ class ArtService:
         
         selected_font = fonts.get(font, fonts["simple"])
         
-        # Create banner
-        lines = [""] * 3  # For simple font height 3 lines
-        
-        for char in text.upper():
-            for i in range(3):
-                if char in selected_font:
-                    lines[i] += selected_font[char]
-                else:
-                    lines[i] += selected_font.get(' ', "   ")
+        # Create banner; each glyph is a single row repeated on all 3 lines
+        default = selected_font.get(' ', "   ")
+        get = selected_font.get
+        line = "".join([get(char, default) for char in text.upper()])
         
         # Apply color
-        result = []
-        for line in lines:
-            result.append(color + line + Color.RESET)
-        
-        return "\n".join(result)
+        return "\n".join([color + line + Color.RESET] * 3)
     
     @staticmethod
     def separator(length: int = 60,
                   char: str = "═",
-                  color: str = Color.GRAY) -> str:
+                  color: str = None) -> str:
         """Create separator line"""
-        return color + char * length + Color.RESET
+        return _separator(length, char, Color.GRAY if color is None else color)
     
     @staticmethod
     def box(text: str,
             title: str = "",
             padding: int = 1,
-            border_color: str = Color.CYAN,
-            title_color: str = Color.CYAN + Color.BOLD) -> str:
+            border_color: str = None,
+            title_color: str = None) -> str:
         """Text in a box with optional title"""
+        if border_color is None:
+            border_color = Color.CYAN
+        if title_color is None:
+            title_color = Color.CYAN + Color.BOLD
         
         lines = text.split('\n')
-        max_len = max(len(Color.strip_colors(line)) for line in lines)
+        clean_lens = [_visible_len(line) for line in lines]
+        max_len = max(clean_lens)
         
         # Top border
         if title:
@@ -872,12 +1124,11 @@ class ArtService:
             top_border = border_color + "╭" + "─" * (max_len + padding * 2 + 2) + "╮"
         
         # Text lines
+        row_template = f"{border_color}│{' ' * padding}%s%s{border_color}│"
         content = []
-        for line in lines:
-            clean_len = len(Color.strip_colors(line))
-            padding_right = max_len - clean_len
-            content.append(border_color + "│" + " " * padding + line + 
-                         " " * (padding + padding_right) + border_color + "│")
+        for line, clean_len in zip(lines, clean_lens):
+            fill = " " * (padding + max_len - clean_len)
+            content.append(row_template % (line, fill))
         
         # Bottom border
         bottom_border = border_color + "╰" + "─" * (max_len + padding * 2 + 2) + "╯"
@@ -889,6 +1140,37 @@ class ArtService:
 # UTILITIES AND COMPATIBILITY
 # ============================================================================
 
+class _CursorBatch:
+    """Context manager that sends queued cursor moves and text in one write"""
+    
+    def __init__(self):
+        self._key = None
+        self._buffer = None
+        self._owner = False
+    
+    def write(self, text: str) -> None:
+        """Queue text so it lands between the batched cursor moves"""
+        self._buffer.append(text)
+    
+    def __enter__(self):
+        import threading
+        self._key = threading.get_ident()
+        # Nested batches share the outermost buffer
+        self._buffer = _cursor_batches.get(self._key)
+        self._owner = self._buffer is None
+        if self._owner:
+            self._buffer = _cursor_batches[self._key] = []
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self._owner:
+            return
+        
+        del _cursor_batches[self._key]
+        if self._buffer:
+            ConsoleUtils._write_frame(*self._buffer, flush=True)
+
+
 class ConsoleUtils:
     """Console utilities"""
     
@@ -905,40 +1187,75 @@ class ConsoleUtils:
     @staticmethod
     def get_size() -> Tuple[int, int]:
         """Get terminal size"""
+        now = time.monotonic()
+        if now - _size_cache[0] < _SIZE_TTL:
+            return _size_cache[1]
+        
         try:
-            return os.get_terminal_size()
+            size = os.get_terminal_size()
         except:
-            return (80, 24)
+            size = (80, 24)
+        
+        _size_cache[0] = now
+        _size_cache[1] = size
+        return size
+    
+    @staticmethod
+    def emit(*parts: str, flush: bool = False) -> None:
+        """Write parts to stdout as one string (no implicit separator or newline)"""
+        stream = sys.stdout
+        if stream is None:
+            # No console (pythonw, detached stdout): drop output like print()
+            return
+        stream.write(''.join(parts))
+        if flush:
+            stream.flush()
+    
+    @staticmethod
+    def _write_frame(*parts: str, flush: Optional[bool] = None) -> None:
+        """Write an animation frame, flushing by default only on terminals"""
+        stream = sys.stdout
+        if stream is None:
+            return
+        stream.write(''.join(parts))
+        
+        # Piped output (not line-buffered) is left to fill the buffer
+        if flush is None:
+            flush = getattr(stream, 'line_buffering', False)
+        if flush:
+            stream.flush()
+    
+    @staticmethod
+    def cursor_batch() -> _CursorBatch:
+        """Batch this thread's cursor helpers into one write; only batch.write() keeps order"""
+        # print(), MessageService and other writes inside the block go out
+        # immediately, i.e. before every queued cursor sequence
+        return _CursorBatch()
     
     @staticmethod
     def hide_cursor():
         """Hide cursor"""
-        sys.stdout.write("\033[?25l")
-        sys.stdout.flush()
+        _cursor_write("\033[?25l")
     
     @staticmethod
     def show_cursor():
         """Show cursor"""
-        sys.stdout.write("\033[?25h")
-        sys.stdout.flush()
+        _cursor_write("\033[?25h")
     
     @staticmethod
     def move_cursor(x: int, y: int):
         """Move cursor"""
-        sys.stdout.write(f"\033[{y};{x}H")
-        sys.stdout.flush()
+        _cursor_write(f"\033[{y};{x}H")
     
     @staticmethod
     def save_position():
         """Save cursor position"""
-        sys.stdout.write("\033[s")
-        sys.stdout.flush()
+        _cursor_write("\033[s")
     
     @staticmethod
     def restore_position():
         """Restore cursor position"""
-        sys.stdout.write("\033[u")
-        sys.stdout.flush()
+        _cursor_write("\033[u")
 
 
 class GlitchPrinterService:
@@ -954,21 +1271,36 @@ class GlitchPrinterService:
     
     def print_glitch_line(self, text, delay=0.03, iterations=3):
         """Glitch effect"""
-        for i in range(len(text) + 1):
+        choices = random.choices
+        glitch_chars = self.glitch_chars
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        length = len(text)
+        
+        # Spaces stay blank in the scrambled part of the line
+        spaces = [j for j, char in enumerate(text) if char == ' ']
+        
+        # No frames are drawn for iterations <= 0, only the final line
+        frame_delay = delay / iterations if iterations > 0 else 0.0
+        target = time.perf_counter()
+        for i in range(length + 1):
+            prefix = '\r' + text[:i]
+            tail_spaces = [j - i for j in spaces[bisect_left(spaces, i):]]
+            
             for _ in range(iterations):
-                line = []
-                for j in range(len(text)):
-                    if j < i:
-                        line.append(text[j])
-                    else:
-                        if text[j] == ' ':
-                            line.append(' ')
-                        else:
-                            line.append(random.choice(self.glitch_chars))
+                tail = choices(glitch_chars, k=length - i)
+                for j in tail_spaces:
+                    tail[j] = ' '
                 
-                sys.stdout.write('\r' + ''.join(line))
-                sys.stdout.flush()
-                time.sleep(delay/iterations)
+                write(prefix + ''.join(tail))
+                flush()
+                
+                target += frame_delay
+                now = time.perf_counter()
+                if target > now:
+                    time.sleep(target - now)
+                else:
+                    target = now
         
         sys.stdout.write('\r' + text + '\n')
         sys.stdout.flush()